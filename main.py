@@ -1,10 +1,29 @@
 from src.network import NetworkList
+import logging
 import sys
 
+class _UnflushedStreamHandler(logging.StreamHandler):
+    """Stream handler that leaves flushing to the stream's own buffering instead of flushing per record."""
+    def flush(self):
+        pass
+
+def _prompt(prompt):
+    """
+    Writes a prompt and reads one line of user input from the buffered stdin.
+    Unlike input(), this skips flushing stderr.
+    Raises EOFError when input is exhausted, like input().
+    """
+    sys.stdout.write(prompt)
+    sys.stdout.flush() # stdout is not line-buffered, so show the prompt before blocking
+    line = sys.stdin.readline()
+    if not line:
+        raise EOFError
+    return line.rstrip('\n')
+
 def get_int_input(prompt):
     while True:
         try:
-            value = int(input(prompt))
+            value = int(_prompt(prompt))
             return value
         except ValueError:
             print("Invalid input. Please enter a number.")
@@ -12,7 +31,7 @@ def get_int_input(prompt):
 def get_float_input(prompt):
     while True:
         try:
-            value = float(input(prompt))
+            value = float(_prompt(prompt))
             return value
         except ValueError:
             print("Invalid input. Please enter a number.")
@@ -20,7 +39,7 @@ def get_float_input(prompt):
 def get_pos_input(prompt):
     while True:
         try:
-            coords = input(prompt).strip().split(',')
+            coords = _prompt(prompt).strip().split(',')
             if len(coords) == 2:
                 x = float(coords[0].strip())
                 y = float(coords[1].strip())
@@ -31,6 +50,15 @@ def get_pos_input(prompt):
             print("Invalid coordinate values. Please enter numbers.")
 
 def main():
+    # Buffer output fully; _prompt flushes before each read so prompts still appear
+    sys.stdout.reconfigure(line_buffering=False)
+    # Simulation events are logged; show them as plain lines on stdout
+    handler = _UnflushedStreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    netsim_log = logging.getLogger('netsim')
+    netsim_log.addHandler(handler)
+    netsim_log.setLevel(logging.INFO)
+    netsim_log.propagate = False
     network_list = NetworkList()
     current_network = None
 
@@ -39,7 +67,7 @@ def main():
     # Initial network setup
     num_networks = get_int_input("Enter the number of networks to create: ")
     for i in range(num_networks):
-        name = input(f"Enter name for Network {i+1}: ").strip()
+        name = _prompt(f"Enter name for Network {i+1}: ").strip()
         if not name:
             print("Network name cannot be empty. Skipping network creation.")
             continue
@@ -68,10 +96,10 @@ def main():
         print("8. Display All Network Summary")
         print("9. Quit")
 
-        choice = input("Enter your choice: ").strip()
+        choice = _prompt("Enter your choice: ").strip()
 
         if choice == '1':
-            tower_name = input("Enter tower name: ").strip()
+            tower_name = _prompt("Enter tower name: ").strip()
             if not tower_name:
                 print("Tower name cannot be empty.")
                 continue
@@ -80,11 +108,11 @@ def main():
             current_network.add_tower(tower_name, pos, height)
 
         elif choice == '2':
-            user_name = input("Enter user name: ").strip()
+            user_name = _prompt("Enter user name: ").strip()
             if not user_name:
                 print("User name cannot be empty.")
                 continue
-            phone_number = input("Enter user phone number: ").strip()
+            phone_number = _prompt("Enter user phone number: ").strip()
             if not phone_number.isdigit() or len(phone_number) < 7:
                 print("Invalid phone number. Must be digits only and at least 7 digits long.")
                 continue
@@ -92,21 +120,21 @@ def main():
             current_network.register_user(user_name, phone_number, initial_pos)
 
         elif choice == '3':
-            phone_number = input("Enter user phone number to move: ").strip()
+            phone_number = _prompt("Enter user phone number to move: ").strip()
             new_pos = get_pos_input("Enter new user position (x,y): ")
             current_network.move_user(phone_number, new_pos)
 
         elif choice == '4':
-            caller_phone = input("Enter caller's phone number: ").strip()
-            receiver_phone = input("Enter receiver's phone number: ").strip()
+            caller_phone = _prompt("Enter caller's phone number: ").strip()
+            receiver_phone = _prompt("Enter receiver's phone number: ").strip()
             current_network.make_call(caller_phone, receiver_phone)
 
         elif choice == '5':
-            user_phone = input("Enter phone number of user to end call for: ").strip()
+            user_phone = _prompt("Enter phone number of user to end call for: ").strip()
             current_network.end_call(user_phone)
 
         elif choice == '6':
-            network_name = input("Enter network name to switch to: ").strip()
+            network_name = _prompt("Enter network name to switch to: ").strip()
             new_network = network_list.get_network(network_name)
             if new_network:
                 current_network = new_network
@@ -1,18 +1,10 @@
 class TelephoneHashMap:
     """
     Implements a hash map for quick user lookup using phone numbers.
-    Each bucket is a list to handle collisions.
+    Backed by Python's built-in dict, which handles hashing and collisions in C.
     """
-    def __init__(self, capacity=100):
-        self.capacity = capacity
-        self.buckets = [[] for _ in range(self.capacity)]
-        self.size = 0
-
-    def _hash(self, key):
-        """Simple hash function based on the sum of digits in the phone number."""
-        if not isinstance(key, str) or not key.isdigit():
-            raise ValueError("Phone number must be a string of digits.")
-        return sum(int(digit) for digit in key) % self.capacity
+    def __init__(self):
+        self._d = {} # {phone_number: User_object}
 
     def insert(self, key, value):
         """
@@ -21,13 +13,9 @@ class TelephoneHashMap:
             key (str): The phone number (user ID).
             value (User object): The User object to store.
         """
-        index = self._hash(key)
-        for i, (k, v) in enumerate(self.buckets[index]):
-            if k == key:
-                self.buckets[index][i] = (key, value) # Update if key exists
-                return
-        self.buckets[index].append((key, value))
-        self.size += 1
+        if not isinstance(key, str) or not key.isdigit():
+            raise ValueError("Phone number must be a string of digits.")
+        self._d[key] = value # Update if key exists
 
     def get(self, key):
         """
@@ -37,11 +25,7 @@ class TelephoneHashMap:
         Returns:
             User object or None: The User object if found, else None.
         """
-        index = self._hash(key)
-        for k, v in self.buckets[index]:
-            if k == key:
-                return v
-        return None
+        return self._d.get(key)
 
     def remove(self, key):
         """
@@ -51,28 +35,14 @@ class TelephoneHashMap:
         Returns:
             User object or None: The removed User object if found, else None.
         """
-        index = self._hash(key)
-        for i, (k, v) in enumerate(self.buckets[index]):
-            if k == key:
-                del self.buckets[index][i]
-                self.size -= 1
-                return v
-        return None
+        return self._d.pop(key, None)
 
     def __len__(self):
-        return self.size
+        return len(self._d)
 
     def __str__(self):
-        items = []
-        for i, bucket in enumerate(self.buckets):
-            if bucket:
-                items.append(f"Bucket {i}: {[(k, v.name if hasattr(v, 'name') else 'N/A') for k, v in bucket]}")
-        return "\n".join(items)
+        return "\n".join(f"{k}: {v.name if hasattr(v, 'name') else 'N/A'}" for k, v in self._d.items())
 
     def get_all_users(self):
         """Returns a list of all user objects stored in the hash map."""
-        all_users = []
-        for bucket in self.buckets:
-            for _, user_obj in bucket:
-                all_users.append(user_obj)
-        return all_users
\ No newline at end of file
+        return list(self._d.values())
@@ -1,5 +1,9 @@
 from collections import deque
+import math
 from src.utils import calculate_distance, is_within_range
+import logging
+
+log = logging.getLogger('netsim')
 
 class Stack:
     """
@@ -43,6 +47,8 @@ class Stack:
 
 class Edge:
     """Represents a connection (edge) between two vertices (towers)."""
+    __slots__ = ('origin', 'destination', 'distance')
+
     def __init__(self, origin, destination, distance=0):
         self.origin = origin          # Vertex object (Tower or MSC)
         self.destination = destination # Vertex object (Tower or MSC)
@@ -55,20 +61,29 @@ class Vertex:
     """
     Represents a generic node in the network graph (e.g., a Tower or an MSC).
     """
+    __slots__ = ('name', 'pos', 'type', 'adjacencies', '_neighbors_cache', 'on_edge_added')
+
     def __init__(self, name, pos, type="generic"):
         self.name = name
         self.pos = pos  # (x, y) coordinates
         self.type = type
         self.adjacencies = {} # {Vertex: Edge_object}
+        self._neighbors_cache = None # Tuple of neighbors, rebuilt after add_edge
+        self.on_edge_added = None # Optional callback, set by the owning graph to track topology changes
 
     def add_edge(self, neighbor, distance):
         """Adds an edge to a neighbor."""
         edge = Edge(self, neighbor, distance)
         self.adjacencies[neighbor] = edge
+        self._neighbors_cache = None
+        if self.on_edge_added is not None:
+            self.on_edge_added()
 
     def get_neighbors(self):
-        """Returns a list of neighboring vertices."""
-        return list(self.adjacencies.keys())
+        """Returns a tuple of neighboring vertices (cached until the next add_edge)."""
+        if self._neighbors_cache is None:
+            self._neighbors_cache = tuple(self.adjacencies)
+        return self._neighbors_cache
 
     def get_edge_to(self, neighbor):
         """Returns the edge connecting to a specific neighbor."""
@@ -82,14 +97,19 @@ class Tower(Vertex):
     Represents a mobile network tower.
     Coverage radius is calculated based on height.
     """
+    __slots__ = ('height', 'coverage_radius', 'coverage_radius_sq', 'connected_users')
+
     BASE_COVERAGE_FACTOR = 50 # Meters per unit of height, example value
 
     def __init__(self, name, pos, height):
         super().__init__(name, pos, type="Tower")
-        if not isinstance(height, (int, float)) or height <= 0:
+        if not isinstance(height, (int, float)) or not height > 0 or not math.isfinite(height):
             raise ValueError("Tower height must be a positive number.")
         self.height = height
         self.coverage_radius = self.height * self.BASE_COVERAGE_FACTOR
+        if not math.isfinite(self.coverage_radius):
+            raise ValueError("Tower height is too large to give a finite coverage radius.")
+        self.coverage_radius_sq = self.coverage_radius * self.coverage_radius # Cached for range checks
         self.connected_users = {} # {phone_number: User_object}
 
     def get_coverage_area(self):
@@ -98,7 +118,7 @@ class Tower(Vertex):
     def connect_user(self, user):
         if user.phone_number not in self.connected_users:
             self.connected_users[user.phone_number] = user
-            print(f"User {user.name} ({user.phone_number}) connected to Tower {self.name}.")
+            log.info("User %s (%s) connected to Tower %s.", user.name, user.phone_number, self.name)
             user.current_tower = self
             return True
         return False
@@ -106,7 +126,7 @@ class Tower(Vertex):
     def disconnect_user(self, user):
         if user.phone_number in self.connected_users:
             del self.connected_users[user.phone_number]
-            print(f"User {user.name} ({user.phone_number}) disconnected from Tower {self.name}.")
+            log.info("User %s (%s) disconnected from Tower %s.", user.name, user.phone_number, self.name)
             user.current_tower = None
             return True
         return False
@@ -120,9 +140,11 @@ class MSCVertex(Vertex):
     Represents a Mobile Switching Center (MSC).
     It manages the central user directory for call routing within its network zone.
     """
+    __slots__ = ('registered_users', 'connected_towers')
+
     def __init__(self, name, pos, telephone_hash_map):
         super().__init__(name, pos, type="MSC")
-        if not isinstance(telephone_hash_map, object) or not hasattr(telephone_hash_map, 'insert'):
+        if not hasattr(telephone_hash_map, 'insert'):
             raise TypeError("telephone_hash_map must be an instance of TelephoneHashMap or similar.")
         self.registered_users = telephone_hash_map # Reference to the network's user registry
         self.connected_towers = {} # {Tower_name: Tower_object} - not all towers connect to MSC directly
@@ -134,6 +156,9 @@ class User:
     """
     Represents a mobile network user.
     """
+    __slots__ = ('name', 'phone_number', '_position', 'current_network', 'current_tower',
+                 'call_status', 'call_partner')
+
     def __init__(self, name, phone_number, initial_pos):
         if not isinstance(name, str) or not name.strip():
             raise ValueError("User name cannot be empty.")
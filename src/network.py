@@ -1,7 +1,25 @@
 from src.models import Tower, MSCVertex, User
 from src.data_structures import TelephoneHashMap
-from src.utils import calculate_distance, is_within_range, is_overlapping
-from collections import deque
+from src.utils import calculate_distance, is_finite_position, is_overlapping_sq, nearest_tower_sq
+from collections import deque, defaultdict
+from array import array
+from bisect import bisect_left, bisect_right
+import logging
+import sys
+
+log = logging.getLogger('netsim')
+
+_MAX_FLOAT = sys.float_info.max
+
+class _LazyJoin:
+    """Wraps a vertex path so its " -> " joined names are only built when formatted for output."""
+    __slots__ = ('path',)
+
+    def __init__(self, path):
+        self.path = path
+
+    def __str__(self):
+        return " -> ".join(v.name for v in self.path)
 
 class Network:
     """
@@ -11,6 +29,21 @@ class Network:
         self.name = name
         self.towers = {}  # {tower_name: Tower_object}
         self.graph_vertices = {} # {vertex_name: Vertex_object} for all graph nodes (towers + MSC)
+        # Uniform spatial grid of towers; the cell size is the largest coverage radius,
+        # so any tower covering a point lies within that point's cell +/- 1.
+        self._grid = defaultdict(list) # {(cell_x, cell_y): [Tower_object, ...]}
+        self._cell = None
+        # Towers sorted by x-coordinate (parallel lists) for the add_tower overlap prefilter
+        self._tower_xs_sorted = []
+        self._towers_by_x = []
+        self._topology_version = 0 # Bumped whenever a vertex joins the graph or an edge is added
+        self._path_cache = {} # {Tower_object: (Vertex, ...)}, valid for the current topology version
+        # Compressed sparse row (CSR) copy of the graph for BFS, rebuilt lazily on topology changes
+        self._vertex_ids = {} # {Vertex_object: vertex_id}
+        self._vertex_by_id = [] # [Vertex_object], indexed by vertex_id
+        self._csr_indptr = array('i', [0])
+        self._csr_indices = array('i')
+        self._csr_version = -1 # Topology version the CSR arrays were built for
         self.telephone_hash_map = TelephoneHashMap() # Central registry for users in this network
         self.msc = MSCVertex(f"{name}_MSC", msc_pos, self.telephone_hash_map)
         self._add_graph_vertex(self.msc) # Add MSC as a central node in the graph
@@ -18,11 +51,62 @@ class Network:
     def _add_graph_vertex(self, vertex):
         """Helper to add any Vertex (Tower, MSC) to the internal graph representation."""
         if vertex.name in self.graph_vertices:
-            print(f"Warning: Vertex '{vertex.name}' already exists in network {self.name}.")
+            log.warning("Warning: Vertex '%s' already exists in network %s.", vertex.name, self.name)
             return False
         self.graph_vertices[vertex.name] = vertex
+        self._vertex_ids[vertex] = len(self._vertex_by_id)
+        self._vertex_by_id.append(vertex)
+        vertex.on_edge_added = self._topology_changed
+        self._topology_changed()
         return True
 
+    def _topology_changed(self):
+        """Bumps the topology version and drops cached paths; called when a vertex or edge is added."""
+        self._topology_version += 1
+        self._path_cache.clear() # Every cached path predates the change
+
+    def _build_csr(self):
+        """Rebuilds the CSR adjacency arrays if the topology changed since the last build."""
+        if self._csr_version == self._topology_version:
+            return
+        vertex_ids = self._vertex_ids
+        indptr = array('i', [0])
+        indices = array('i')
+        for vertex in self._vertex_by_id:
+            indices.extend(vertex_ids[neighbor] for neighbor in vertex.get_neighbors())
+            indptr.append(len(indices))
+        self._csr_indptr = indptr
+        self._csr_indices = indices
+        self._csr_version = self._topology_version
+
+    @staticmethod
+    def _grid_key(pos, cell):
+        """Returns the grid cell containing a position for the given cell size."""
+        try:
+            return (int(pos[0] // cell), int(pos[1] // cell))
+        except OverflowError:
+            # Only a vanishingly small cell pushes the index past the float range; pin it to the edge
+            return tuple(int(max(-_MAX_FLOAT, min(_MAX_FLOAT, c // cell))) for c in pos)
+
+    @staticmethod
+    def _build_grid(towers, cell):
+        """Returns a new grid binning the given towers by the given cell size."""
+        grid = defaultdict(list)
+        for tower in towers:
+            grid[Network._grid_key(tower.pos, cell)].append(tower)
+        return grid
+
+    def _towers_near(self, pos):
+        """Yields towers in the 3x3 block of grid cells around the given position."""
+        if self._cell is None:
+            return
+        cx, cy = self._grid_key(pos, self._cell)
+        for gx in range(cx - 1, cx + 2):
+            for gy in range(cy - 1, cy + 2):
+                cell = self._grid.get((gx, gy))
+                if cell:
+                    yield from cell
+
     def add_tower(self, tower_name, pos, height):
         """
         Adds a new tower to the network, ensuring no overlapping coverage.
@@ -34,22 +118,49 @@ class Network:
             Tower or None: The added Tower object if successful, None otherwise.
         """
         if not isinstance(tower_name, str) or not tower_name.strip():
-            print("Error: Tower name cannot be empty.")
+            log.error("Error: Tower name cannot be empty.")
             return None
         if tower_name in self.towers:
-            print(f"Error: Tower '{tower_name}' already exists in network '{self.name}'.")
+            log.error("Error: Tower '%s' already exists in network '%s'.", tower_name, self.name)
+            return None
+        if not is_finite_position(pos):
+            log.error("Error: Tower position %s must have finite coordinates.", pos)
             return None
 
-        new_tower = Tower(tower_name, pos, height)
+        try:
+            new_tower = Tower(tower_name, pos, height)
+        except ValueError as e:
+            log.error("Error: %s", e)
+            return None
 
         # Check for overlapping coverage with existing towers
-        for existing_tower in self.towers.values():
-            if is_overlapping(new_tower.pos, new_tower.coverage_radius,
-                              existing_tower.pos, existing_tower.coverage_radius):
-                print(f"Error: Tower '{tower_name}' coverage overlaps with '{existing_tower.name}'. "
-                      "Cannot add tower.")
+        new_radius = new_tower.coverage_radius
+        # Only towers whose x lies within the largest possible combined radius can overlap;
+        # the grid cell size doubles as the largest existing coverage radius.
+        new_x = new_tower.pos[0]
+        window = new_radius + (self._cell or 0)
+        lo = bisect_left(self._tower_xs_sorted, new_x - window)
+        hi = bisect_right(self._tower_xs_sorted, new_x + window)
+        for existing_tower in self._towers_by_x[lo:hi]:
+            combined_radius = new_radius + existing_tower.coverage_radius
+            if is_overlapping_sq(new_tower.pos, combined_radius * combined_radius, existing_tower.pos):
+                log.error("Error: Tower '%s' coverage overlaps with '%s'. Cannot add tower.",
+                          tower_name, existing_tower.name)
                 return None
 
+        # Work out the new index state in locals, then commit it all at once
+        insert_at = bisect_right(self._tower_xs_sorted, new_x)
+        if self._cell is None or new_radius > self._cell:
+            new_cell = new_radius
+            new_grid = self._build_grid(self._towers_by_x + [new_tower], new_cell)
+        else:
+            new_cell = self._cell
+            new_grid = self._grid
+            new_grid[self._grid_key(new_tower.pos, new_cell)].append(new_tower)
+        self._cell = new_cell
+        self._grid = new_grid
+        self._tower_xs_sorted.insert(insert_at, new_x)
+        self._towers_by_x.insert(insert_at, new_tower)
         self.towers[tower_name] = new_tower
         self._add_graph_vertex(new_tower)
 
@@ -59,7 +170,7 @@ class Network:
         distance_to_msc = calculate_distance(new_tower.pos, self.msc.pos)
         new_tower.add_edge(self.msc, distance_to_msc)
         self.msc.add_edge(new_tower, distance_to_msc) # MSC also knows about the tower
-        print(f"Tower '{tower_name}' added to network '{self.name}' with coverage radius {new_tower.coverage_radius:.2f}m.")
+        log.info("Tower '%s' added to network '%s' with coverage radius %.2fm.", tower_name, self.name, new_tower.coverage_radius)
         return new_tower
 
     def register_user(self, user_name, phone_number, initial_pos):
@@ -73,13 +184,16 @@ class Network:
             User or None: The registered User object if successful, None otherwise.
         """
         if self.telephone_hash_map.get(phone_number):
-            print(f"Error: User with phone number {phone_number} already registered in network '{self.name}'.")
+            log.error("Error: User with phone number %s already registered in network '%s'.", phone_number, self.name)
+            return None
+        if not is_finite_position(initial_pos):
+            log.error("Error: User position %s must have finite coordinates.", initial_pos)
             return None
 
         user = User(user_name, phone_number, initial_pos)
         self.telephone_hash_map.insert(phone_number, user)
         user.current_network = self
-        print(f"User {user.name} ({user.phone_number}) registered to network '{self.name}'.")
+        log.info("User %s (%s) registered to network '%s'.", user.name, user.phone_number, self.name)
 
         # Attempt to connect to the nearest tower
         self._connect_user_to_nearest_tower(user)
@@ -87,32 +201,25 @@ class Network:
 
     def _connect_user_to_nearest_tower(self, user):
         """Internal method to find and connect a user to the nearest available tower."""
-        nearest_tower = None
-        min_distance = float('inf')
-
-        for tower in self.towers.values():
-            if is_within_range(user.position, tower.pos, tower.coverage_radius):
-                distance = calculate_distance(user.position, tower.pos)
-                if distance < min_distance:
-                    min_distance = distance
-                    nearest_tower = tower
+        user_pos = user.position
+        nearest_tower, _ = nearest_tower_sq(user_pos[0], user_pos[1], self._towers_near(user_pos))
 
         if nearest_tower:
             if user.current_tower and user.current_tower != nearest_tower:
                 # Handover scenario
-                print(f"Handover: User {user.name} moving from {user.current_tower.name} to {nearest_tower.name}")
+                log.info("Handover: User %s moving from %s to %s", user.name, user.current_tower.name, nearest_tower.name)
                 user.current_tower.disconnect_user(user)
                 nearest_tower.connect_user(user)
             elif not user.current_tower:
                 nearest_tower.connect_user(user)
             else:
-                print(f"User {user.name} remains connected to {user.current_tower.name}.")
+                log.info("User %s remains connected to %s.", user.name, user.current_tower.name)
             return True
         else:
             if user.current_tower:
                 user.current_tower.disconnect_user(user)
             user.current_tower = None
-            print(f"User {user.name} ({user.phone_number}) is currently outside network '{self.name}' coverage.")
+            log.info("User %s (%s) is currently outside network '%s' coverage.", user.name, user.phone_number, self.name)
             return False
 
     def move_user(self, user_phone_number, new_pos):
@@ -126,12 +233,15 @@ class Network:
         """
         user = self.telephone_hash_map.get(user_phone_number)
         if not user:
-            print(f"Error: User with phone number {user_phone_number} not found in network '{self.name}'.")
+            log.error("Error: User with phone number %s not found in network '%s'.", user_phone_number, self.name)
+            return False
+        if not is_finite_position(new_pos):
+            log.error("Error: User position %s must have finite coordinates.", new_pos)
             return False
 
         old_pos = user.position
         user.position = new_pos
-        print(f"User {user.name} moved from {old_pos} to {new_pos}.")
+        log.info("User %s moved from %s to %s.", user.name, old_pos, new_pos)
 
         self._connect_user_to_nearest_tower(user)
         return True
@@ -139,33 +249,51 @@ class Network:
     def _find_path_to_msc(self, start_tower):
         """
         Finds the path from a start_tower to the MSC using Breadth-First Search (BFS).
-        Returns a list of vertices representing the path, or None if no path.
+        Returns a tuple of vertices representing the path, or None if no path.
+        Paths are memoized per tower until the topology changes.
         """
         if not isinstance(start_tower, Tower) or start_tower.name not in self.graph_vertices:
             return None # Not a valid starting point in this graph
 
-        # BFS for shortest path
+        # Towers link directly to the MSC, so the shortest path is just the one hop
+        if self.msc in start_tower.adjacencies:
+            return (start_tower, self.msc)
+
+        cached_path = self._path_cache.get(start_tower)
+        if cached_path is not None:
+            return cached_path
+
+        # BFS for shortest path over the integer CSR arrays
+        self._build_csr()
+        indptr = self._csr_indptr
+        indices = self._csr_indices
+        start_id = self._vertex_ids[start_tower]
+        msc_id = self._vertex_ids[self.msc]
         queue = deque()
-        queue.append(start_tower)
-        visited = {start_tower.name}
-        parent_map = {start_tower.name: None}
+        queue.append(start_id)
+        visited = bytearray(len(self._vertex_by_id))
+        visited[start_id] = 1
+        parent = array('i', [-1]) * len(self._vertex_by_id)
 
         while queue:
-            current_vertex = queue.popleft()
+            current_id = queue.popleft()
 
-            if current_vertex == self.msc:
+            if current_id == msc_id:
                 # Path found, reconstruct
                 path = []
-                while current_vertex:
-                    path.insert(0, current_vertex)
-                    current_vertex = parent_map[current_vertex.name]
+                while current_id != -1:
+                    path.append(self._vertex_by_id[current_id])
+                    current_id = parent[current_id]
+                path.reverse()
+                path = tuple(path) # Immutable, so the cached copy can be shared with callers
+                self._path_cache[start_tower] = path
                 return path
 
-            for neighbor in current_vertex.get_neighbors():
-                if neighbor.name not in visited:
-                    visited.add(neighbor.name)
-                    parent_map[neighbor.name] = current_vertex
-                    queue.append(neighbor)
+            for neighbor_id in indices[indptr[current_id]:indptr[current_id + 1]]:
+                if not visited[neighbor_id]:
+                    visited[neighbor_id] = 1
+                    parent[neighbor_id] = current_id
+                    queue.append(neighbor_id)
         return None # No path found
 
     def make_call(self, caller_phone_number, receiver_phone_number):
@@ -182,48 +310,54 @@ class Network:
         receiver = self.telephone_hash_map.get(receiver_phone_number)
 
         if not caller:
-            print(f"Error: Caller ({caller_phone_number}) not found in network '{self.name}'.")
+            log.error("Error: Caller (%s) not found in network '%s'.", caller_phone_number, self.name)
             return False
         if not receiver:
-            print(f"Error: Receiver ({receiver_phone_number}) not found in network '{self.name}'.")
+            log.error("Error: Receiver (%s) not found in network '%s'.", receiver_phone_number, self.name)
             return False
 
         if caller == receiver:
-            print("Error: Cannot call yourself.")
+            log.error("Error: Cannot call yourself.")
             return False
 
         if caller.call_status != "idle" or receiver.call_status != "idle":
-            print(f"Error: One or both users are already on a call. Caller status: {caller.call_status}, Receiver status: {receiver.call_status}")
+            log.error("Error: One or both users are already on a call. Caller status: %s, Receiver status: %s", caller.call_status, receiver.call_status)
             return False
 
         if not caller.current_tower:
-            print(f"Call failed: Caller {caller.name} is outside network coverage.")
+            log.warning("Call failed: Caller %s is outside network coverage.", caller.name)
             return False
         if not receiver.current_tower:
-            print(f"Call failed: Receiver {receiver.name} is outside network coverage.")
+            log.warning("Call failed: Receiver %s is outside network coverage.", receiver.name)
             return False
 
-        print(f"\nAttempting call from {caller.name} ({caller_phone_number}) to {receiver.name} ({receiver_phone_number})...")
+        log.info("\nAttempting call from %s (%s) to %s (%s)...", caller.name, caller_phone_number, receiver.name, receiver_phone_number)
 
-        # Path for caller to MSC
-        path_caller_to_msc = self._find_path_to_msc(caller.current_tower)
-        if not path_caller_to_msc:
-            print(f"Call failed: No path found from caller's tower ({caller.current_tower.name}) to MSC.")
-            return False
-
-        # Path for MSC to receiver
-        path_msc_to_receiver = self._find_path_to_msc(receiver.current_tower)
-        if not path_msc_to_receiver:
-            print(f"Call failed: No path found from MSC to receiver's tower ({receiver.current_tower.name}).")
-            return False
-
-        # Construct full call path
-        # The path from MSC to receiver's tower is typically the reverse of receiver's tower to MSC.
-        # So, we reverse the receiver's path to get MSC -> ... -> receiver_tower
-        full_call_path = path_caller_to_msc + path_msc_to_receiver[::-1][1:] # [1:] to avoid duplicating MSC
-        path_names = " -> ".join([v.name for v in full_call_path])
-
-        print(f"Call established! Routing path: {path_names}")
+        caller_tower = caller.current_tower
+        receiver_tower = receiver.current_tower
+        if self.msc in caller_tower.adjacencies and self.msc in receiver_tower.adjacencies:
+            # Star topology fast path: both towers link straight to the MSC, so skip BFS
+            full_call_path = (caller_tower, self.msc, receiver_tower)
+        else:
+            # Path for caller to MSC
+            path_caller_to_msc = self._find_path_to_msc(caller_tower)
+            if not path_caller_to_msc:
+                log.warning("Call failed: No path found from caller's tower (%s) to MSC.", caller_tower.name)
+                return False
+
+            # Path for MSC to receiver
+            path_msc_to_receiver = self._find_path_to_msc(receiver_tower)
+            if not path_msc_to_receiver:
+                log.warning("Call failed: No path found from MSC to receiver's tower (%s).", receiver_tower.name)
+                return False
+
+            # Construct full call path
+            # The path from MSC to receiver's tower is typically the reverse of receiver's tower to MSC.
+            # So, we reverse the receiver's path to get MSC -> ... -> receiver_tower
+            full_call_path = path_caller_to_msc + path_msc_to_receiver[::-1][1:] # [1:] to avoid duplicating MSC
+
+        # The route string is only joined if a handler actually emits the record
+        log.info("Call established! Routing path: %s", _LazyJoin(full_call_path))
         caller.call_status = "calling"
         receiver.call_status = "receiving"
         caller.call_partner = receiver
@@ -234,47 +368,48 @@ class Network:
         """Ends a call involving the specified user."""
         user = self.telephone_hash_map.get(user_phone_number)
         if not user:
-            print(f"Error: User {user_phone_number} not found.")
+            log.error("Error: User %s not found.", user_phone_number)
             return False
 
         if user.call_status == "idle":
-            print(f"User {user.name} is not on a call.")
+            log.info("User %s is not on a call.", user.name)
             return False
 
         partner = user.call_partner
         if partner:
-            print(f"Call between {user.name} and {partner.name} ended.")
+            log.info("Call between %s and %s ended.", user.name, partner.name)
             user.call_status = "idle"
             user.call_partner = None
             partner.call_status = "idle"
             partner.call_partner = None
             return True
         else:
-            print(f"Error: User {user.name} in call state {user.call_status} but no partner found.")
+            log.error("Error: User %s in call state %s but no partner found.", user.name, user.call_status)
             user.call_status = "idle" # Reset just in case
             return False
 
     def display_network_info(self):
         """Prints details about the network, its towers, and connected users."""
-        print(f"\n--- Network: {self.name} ---")
-        print(f"  MSC: {self.msc}")
-        print(f"  Towers ({len(self.towers)}):")
+        # Collect every line first and emit them with a single write
+        lines = [f"\n--- Network: {self.name} ---",
+                 f"  MSC: {self.msc}",
+                 f"  Towers ({len(self.towers)}):"]
         if not self.towers:
-            print("    No towers added yet.")
+            lines.append("    No towers added yet.")
         for tower in self.towers.values():
-            print(f"    - {tower}")
+            lines.append(f"    - {tower}")
             if tower.connected_users:
-                print(f"      Connected Users ({len(tower.connected_users)}):")
-                for user_phone, user_obj in tower.connected_users.items():
-                    print(f"        - {user_obj.name} ({user_obj.phone_number}) at {user_obj.position}")
+                lines.append(f"      Connected Users ({len(tower.connected_users)}):")
+                lines.extend(f"        - {user_obj.name} ({user_obj.phone_number}) at {user_obj.position}"
+                             for user_obj in tower.connected_users.values())
             else:
-                print("      No users connected.")
-        print(f"  Registered Users ({len(self.telephone_hash_map)}):")
+                lines.append("      No users connected.")
+        lines.append(f"  Registered Users ({len(self.telephone_hash_map)}):")
         if len(self.telephone_hash_map) == 0:
-            print("    No users registered yet.")
+            lines.append("    No users registered yet.")
         else:
-            for user in self.telephone_hash_map.get_all_users():
-                print(f"    - {user}")
+            lines.extend(f"    - {user}" for user in self.telephone_hash_map.get_all_users())
+        sys.stdout.write("\n".join(lines) + "\n")
 
 class NetworkList:
     """
@@ -286,11 +421,11 @@ class NetworkList:
     def add_network(self, network_name, msc_pos=(0, 0)):
         """Adds a new network zone to the system."""
         if network_name in self.networks:
-            print(f"Error: Network '{network_name}' already exists.")
+            log.error("Error: Network '%s' already exists.", network_name)
             return None
         new_network = Network(network_name, msc_pos)
         self.networks[network_name] = new_network
-        print(f"Network '{network_name}' created.")
+        log.info("Network '%s' created.", network_name)
         return new_network
 
     def get_network(self, network_name):
@@ -9,7 +9,45 @@ def calculate_distance(pos1, pos2):
     Returns:
         float: The Euclidean distance between the two points.
     """
-    return math.sqrt((pos1[0] - pos2[0])**2 + (pos1[1] - pos2[1])**2)
+    return math.sqrt(_distance_sq(pos1, pos2))
+
+def is_finite_position(pos):
+    """
+    Checks that both coordinates of a position are finite numbers (not NaN or +/-inf).
+    Args:
+        pos (tuple): A position (x, y).
+    Returns:
+        bool: True if both coordinates are finite, False otherwise.
+    """
+    return math.isfinite(pos[0]) and math.isfinite(pos[1])
+
+def _distance_sq(pos1, pos2):
+    """Returns the squared Euclidean distance between two points (x, y)."""
+    dx = pos1[0] - pos2[0]
+    dy = pos1[1] - pos2[1]
+    return dx * dx + dy * dy
+
+def nearest_tower_sq(x, y, towers):
+    """
+    Finds the closest tower whose coverage includes the point (x, y).
+    Args:
+        x (float): X-coordinate of the point.
+        y (float): Y-coordinate of the point.
+        towers (iterable): Candidate Tower objects (need `pos` and `coverage_radius_sq`).
+    Returns:
+        tuple: (Tower or None, float) - the nearest covering tower and its squared distance.
+    """
+    nearest = None
+    min_d2 = float('inf')
+    for tower in towers:
+        tx, ty = tower.pos
+        dx = tx - x
+        dy = ty - y
+        d2 = dx * dx + dy * dy
+        if d2 <= tower.coverage_radius_sq and d2 < min_d2:
+            min_d2 = d2
+            nearest = tower
+    return nearest, min_d2
 
 def is_within_range(user_pos, tower_pos, coverage_radius):
     """
@@ -21,7 +59,7 @@ def is_within_range(user_pos, tower_pos, coverage_radius):
     Returns:
         bool: True if the user is within range, False otherwise.
     """
-    return calculate_distance(user_pos, tower_pos) <= coverage_radius
+    return _distance_sq(user_pos, tower_pos) <= coverage_radius * coverage_radius
 
 def is_overlapping(tower1_pos, tower1_radius, tower2_pos, tower2_radius):
     """
@@ -34,5 +72,18 @@ def is_overlapping(tower1_pos, tower1_radius, tower2_pos, tower2_radius):
     Returns:
         bool: True if coverage areas overlap, False otherwise.
     """
-    distance = calculate_distance(tower1_pos, tower2_pos)
-    return distance < (tower1_radius + tower2_radius)
\ No newline at end of file
+    combined_radius = tower1_radius + tower2_radius
+    return _distance_sq(tower1_pos, tower2_pos) < combined_radius * combined_radius
+
+def is_overlapping_sq(tower1_pos, combined_radius_sq, tower2_pos):
+    """
+    Checks if the coverage areas of two towers overlap, given the precomputed
+    square of their combined radii.
+    Args:
+        tower1_pos (tuple): Position of the first tower (x, y).
+        combined_radius_sq (float): (tower1_radius + tower2_radius) ** 2.
+        tower2_pos (tuple): Position of the second tower (x, y).
+    Returns:
+        bool: True if coverage areas overlap, False otherwise.
+    """
+    return _distance_sq(tower1_pos, tower2_pos) < combined_radius_sq
\ No newline at end of file